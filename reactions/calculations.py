@@ -9,6 +9,7 @@ import pandas as pd
 import scipy.constants as cs
 
 from .constants import FINE_STRUCTURE_CONSTANT_MEV_FM, HBAR_MEV_S
+from .kernels import barrier_integral, decay_kernel, group_sum
 from .units import Energy, Power, Distance
 from .views import DecayTerminalView
 
@@ -86,11 +87,21 @@ class ReactionEnergy:
         self.value = Energy.load(kev=self._kev())
 
     def _kev(self):
-        lvalues = sum(num * i.mass_excess_kev for num, i in self.reaction.initial_lvalues)
-        rvalues = sum(num * i.mass_excess_kev for num, i in self.reaction.rvalues)
+        lvalues = mass_excess_kev(self.reaction.initial_lvalues)
+        rvalues = mass_excess_kev(self.reaction.rvalues)
         return lvalues - rvalues
 
 
+def mass_excess_kev(pairs):
+    """Total mass excess of a list of (count, nuclide) pairs."""
+    # A plain loop rather than sum() over a generator, or NumPy, which is
+    # slower still for the two or three terms in a reaction.
+    total = 0
+    for num, nuclide in pairs:
+        total += num * nuclide.mass_excess_kev
+    return total
+
+
 class GeigerNuttal(Calculation):
     """Model the Geiger-Nuttal law."""
 
@@ -159,29 +170,37 @@ class IsotopicDecay(Calculation):
         self.q_value = q_value
         self.kwargs = kwargs
         self.smaller, self.larger = daughters
-        self.data = self._data()
-
-    def _data(self):
-        heavier_daughter_z = self.larger.atomic_number
-        return {
-            'parent': self.parent.label,
-            'daughters': ', '.join([self.larger.label, self.smaller.label]),
-            'parent_z': self.parent_z,
-            'parent_a': self.parent_a,
-            'lighter_daughter_z': self.smaller.atomic_number,
-            'lighter_daughter_a': self.smaller.mass_number,
-            'heavier_daughter_z': heavier_daughter_z,
-            'heavier_daughter_a': self.larger.mass_number,
-            'lighter_mass_mev': self.smaller.mass.mev,
-            'heavier_daughter_mass_mev': self.larger.mass.mev,
-            'q_value_mev': self.q_value.mev,
-            'isotopic_abundance': self.parent.isotopic_abundance,
-            'deposited_q_value_joules': self.q_value.joules,
-        }
+        self.row = self._row()
+        self.data = dict(zip(Decay.initial_column_names, self.row))
+
+    def _row(self):
+        """Return the values for this decay in the order of
+        `Decay.initial_column_names`.
+        """
+        smaller, larger = self.smaller, self.larger
+        q_value = self.q_value
+        return (
+            self.parent_z,
+            self.parent_a,
+            self.parent.label,
+            ', '.join([larger.label, smaller.label]),
+            larger.atomic_number,
+            smaller.mass_number,
+            larger.mass_number,
+            smaller.atomic_number,
+            smaller.mass.mev,
+            larger.mass.mev,
+            q_value.mev,
+            self.parent.isotopic_abundance,
+            q_value.joules,
+        )
 
     def __getitem__(self, key):
         return self.data[key]
 
+    def __iter__(self):
+        return iter(self.row)
+
 
 class DecayScenario:
     """Compute various quantities for a given radioactive system at different
@@ -199,7 +218,9 @@ class DecayScenario:
     avogadros_number, _, _ = cs.physical_constants['Avogadro constant']
 
     def __init__(self, base_df, reactions, **kwargs):
-        self.base_df = base_df.copy()
+        # The base dataframe is only ever read, so scenarios recalculated
+        # from this one can share it rather than each holding a copy.
+        self.base_df = base_df
         self.reactions = reactions
         self.kwargs = kwargs
         self.df = self.calculate(base_df, kwargs)
@@ -220,14 +241,14 @@ class DecayScenario:
 
     def calculate(self, df, kwargs):
         """Return a Pandas dataframe with various steps in the calculation."""
-        df = df.copy()
-        df = self.calculate_preliminaries(df, kwargs)
-        df = self.calculate_gamow_factor(df, kwargs)
-        df = self.calculate_decay_constant(df, kwargs)
-        df = self.calculate_products(df, kwargs)
-        return df
-
-    def calculate_gamow_factor(self, df, kwargs):
+        values = {c: df[c].to_numpy() for c in df.columns}
+        self.calculate_preliminaries(values, kwargs)
+        self.calculate_gamow_factor(values, kwargs)
+        self.calculate_decay_constant(values, kwargs)
+        self.calculate_products(values, kwargs)
+        return pd.DataFrame(values, index=df.index)
+
+    def calculate_gamow_factor(self, values, kwargs):
         """Gamow factor to be calculated by subclasses."""
         raise NotImplementedError
 
@@ -251,81 +272,93 @@ class DecayScenario:
         """How many active nuclides are left?"""
         return self.recalculate(**kwargs).df.remaining_active_atoms.sum()
 
-    def calculate_preliminaries(self, df, kwargs):
+    def calculate_preliminaries(self, values, kwargs):
         """Compute various starting quantities for this result."""
-        df['screening'] = kwargs.get('screening') or 0
-        df['screened_heavier_daughter_z'] = df.heavier_daughter_z - df.screening
-        df['lighter_ke_mev'] = df.q_value_mev / \
-            (1 + df.lighter_mass_mev / df.heavier_daughter_mass_mev)
-        df['nuclear_separation_radius_fm'] = 1.2 * (np.power(df.lighter_daughter_a, 1./3) + \
-            np.power(df.heavier_daughter_a, 1./3))
-        df['lighter_velocity_m_per_s'] = np.sqrt(2 * df.lighter_ke_mev / df.lighter_mass_mev) * \
-            self.speed_of_light
-        df['barrier_assault_frequency'] = df.lighter_velocity_m_per_s * math.pow(10, 15) / \
-            (2 * df.nuclear_separation_radius_fm)
+        screening = kwargs.get('screening') or 0
+        screened_z = values['heavier_daughter_z'] - screening
+        lighter_mass = values['lighter_mass_mev']
+        lighter_ke = values['q_value_mev'] / \
+            (1 + lighter_mass / values['heavier_daughter_mass_mev'])
+        separation = 1.2 * (np.cbrt(values['lighter_daughter_a']) + \
+            np.cbrt(values['heavier_daughter_a']))
+        velocity = np.sqrt(2 * lighter_ke / lighter_mass) * self.speed_of_light
         # rc = float(Z) * Z4 * 1.43998 / Q
-        df['coulomb_barrier_radius_fm'] = df.screened_heavier_daughter_z * df.lighter_daughter_z * \
-            self.e2_4pi / df.q_value_mev
+        barrier_radius = screened_z * values['lighter_daughter_z'] * \
+            self.e2_4pi / values['q_value_mev']
+        values['screening'] = screening
+        values['screened_heavier_daughter_z'] = screened_z
+        values['lighter_ke_mev'] = lighter_ke
+        values['nuclear_separation_radius_fm'] = separation
+        values['lighter_velocity_m_per_s'] = velocity
+        values['barrier_assault_frequency'] = velocity * math.pow(10, 15) / (2 * separation)
+        values['coulomb_barrier_radius_fm'] = barrier_radius
         # r  = rs / rc
-        df['radius_ratio'] = df.nuclear_separation_radius_fm / df.coulomb_barrier_radius_fm
-        return df
+        values['radius_ratio'] = separation / barrier_radius
 
-    def calculate_decay_constant(self, df, _):
+    def calculate_decay_constant(self, values, _):
         """Compute intermediate values for this result."""
-        df['tunneling_probability'] = np.exp(-2 * df.gamow_factor)
-        df['partial_decay_constant'] = df.tunneling_probability * df.barrier_assault_frequency
-        df['isotope_decay_constant'] = df.groupby(['parent_a', 'parent_z']) \
-            .partial_decay_constant.transform(np.sum)
-        df['partial_half_life'] = np.where(
-            df.partial_decay_constant > 0,
-            math.log(2) / df.partial_decay_constant,
-            math.inf,
+        tunneling, partial, half_life = decay_kernel(
+            values['gamow_factor'],
+            values['barrier_assault_frequency'],
         )
-        return df
+        values['tunneling_probability'] = tunneling
+        values['partial_decay_constant'] = partial
+        values['isotope_decay_constant'] = group_sum(
+            partial,
+            values['parent_a'],
+            values['parent_z'],
+        )
+        values['partial_half_life'] = half_life
 
-    def calculate_products(self, df, kwargs):
+    def calculate_products(self, values, kwargs):
         """Compute various final metrics of interest."""
         elapsed = kwargs['seconds']
-        df['starting_moles'] = kwargs['moles'] * \
-            (kwargs.get('isotopic_fraction') or df.parent_fraction)
-        df['active_fraction'] = kwargs.get('active_fraction') or 1
-        df['starting_active_moles'] = df.starting_moles * df.active_fraction
-        df['starting_active_atoms'] = df.starting_active_moles * self.avogadros_number
-        df['remaining_active_atoms'] = df.starting_active_atoms * \
-            np.exp(-df.isotope_decay_constant * elapsed)
-        df['partial_activity'] = df.partial_decay_constant * df.remaining_active_atoms
-        df['watts'] = df.partial_activity * df.deposited_q_value_joules
-        return df
+        starting_moles = kwargs['moles'] * \
+            (kwargs.get('isotopic_fraction') or values['parent_fraction'])
+        active_fraction = kwargs.get('active_fraction') or 1
+        starting_active_moles = starting_moles * active_fraction
+        starting_active_atoms = starting_active_moles * self.avogadros_number
+        remaining = np.multiply(-elapsed, values['isotope_decay_constant'])
+        np.exp(remaining, out=remaining)
+        remaining *= starting_active_atoms
+        activity = values['partial_decay_constant'] * remaining
+        values['starting_moles'] = starting_moles
+        values['active_fraction'] = active_fraction
+        values['starting_active_moles'] = starting_active_moles
+        values['starting_active_atoms'] = starting_active_atoms
+        values['remaining_active_atoms'] = remaining
+        values['partial_activity'] = activity
+        values['watts'] = activity * values['deposited_q_value_joules']
 
 
 class HyperphysicsDecayScenario(DecayScenario):
     """From http://hyperphysics.phy-astr.gsu.edu/hbase/nuclear/alpdec.html."""
 
-    def calculate_gamow_factor(self, df, kwargs):
-        df['barrier_height_mev'] = 2 * df.screened_heavier_daughter_z * \
-            self.e2_4pi / df.nuclear_separation_radius_fm
-        r = df.lighter_ke_mev / df.barrier_height_mev
-        ph = math.sqrt(2) * np.sqrt(df.lighter_mass_mev / df.lighter_ke_mev)
-        G = np.where(r >= 1, 0, np.arccos(np.sqrt(r)) - np.sqrt(r * (1 - r)))
-        df['gamow_factor'] = self.e2_4pi / self.hbarc * df.screened_heavier_daughter_z * \
-            df.lighter_daughter_z * G * ph
-        return df
+    def calculate_gamow_factor(self, values, kwargs):
+        screened_z = values['screened_heavier_daughter_z']
+        lighter_ke = values['lighter_ke_mev']
+        barrier_height = 2 * screened_z * self.e2_4pi / values['nuclear_separation_radius_fm']
+        r = lighter_ke / barrier_height
+        ph = math.sqrt(2) * np.sqrt(values['lighter_mass_mev'] / lighter_ke)
+        G = barrier_integral(r)
+        values['barrier_height_mev'] = barrier_height
+        values['gamow_factor'] = self.e2_4pi / self.hbarc * screened_z * \
+            values['lighter_daughter_z'] * G * ph
 
 
 class HermesDecayScenario(DecayScenario):
     """Hermes's calculation of the Gamow factor."""
 
-    def calculate_gamow_factor(self, df, kwargs):
+    def calculate_gamow_factor(self, values, kwargs):
+        A = values['heavier_daughter_a']
+        A4 = values['lighter_daughter_a']
         # m  = (float(A) * A4) / (A + A4)
-        m = (df.heavier_daughter_a * df.lighter_daughter_a) / \
-            (df.heavier_daughter_a + df.lighter_daughter_a)
+        m = (A * A4) / (A + A4)
         # G  = 0 if r >= 1 else math.acos(math.sqrt(r)) - math.sqrt(r * (1. - r))
-        G = np.where(df.radius_ratio >= 1, 0, np.arccos(np.sqrt(df.radius_ratio)) - \
-            np.sqrt(df.radius_ratio * (1 - df.radius_ratio)))
+        G = barrier_integral(values['radius_ratio'])
         # return 0.2708122 * Z * Z4 * G * math.sqrt(m / Q)
-        df['gamow_factor'] = 0.2708122 * df.screened_heavier_daughter_z * \
-            df.lighter_daughter_z * G * np.sqrt(m / df.q_value_mev)
-        return df
+        values['gamow_factor'] = 0.2708122 * values['screened_heavier_daughter_z'] * \
+            values['lighter_daughter_z'] * G * np.sqrt(m / values['q_value_mev'])
 
 
 class Decay:
@@ -333,22 +366,24 @@ class Decay:
     different assumptions.
     """
 
-    initial_column_names = [
-        'parent_z',
-        'parent_a',
-        'parent',
-        'daughters',
-        'heavier_daughter_z',
-        'lighter_daughter_a',
-        'heavier_daughter_a',
-        'lighter_daughter_z',
-        'lighter_mass_mev',
-        'heavier_daughter_mass_mev',
-        'q_value_mev',
-        'isotopic_abundance',
-        'deposited_q_value_joules',
+    initial_columns = [
+        ('parent_z', np.int64),
+        ('parent_a', np.int64),
+        ('parent', object),
+        ('daughters', object),
+        ('heavier_daughter_z', np.int64),
+        ('lighter_daughter_a', np.int64),
+        ('heavier_daughter_a', np.int64),
+        ('lighter_daughter_z', np.int64),
+        ('lighter_mass_mev', np.float64),
+        ('heavier_daughter_mass_mev', np.float64),
+        ('q_value_mev', np.float64),
+        ('isotopic_abundance', np.float64),
+        ('deposited_q_value_joules', np.float64),
     ]
 
+    initial_column_names = [name for name, _ in initial_columns]
+
     @classmethod
     def load(cls, **kwargs):
         """Factory method that returns the possible decays for a given parent
@@ -370,15 +405,13 @@ class Decay:
         self.df = self._initial_dataframe()
 
     def _initial_dataframe(self):
-        rows = []
-        for decay in self.decays:
-            rows.append([decay[c] for c in self.initial_column_names])
-        if rows:
-            df = pd.DataFrame(rows, columns=self.initial_column_names)
-        else:
-            df = pd.DataFrame(columns=self.initial_column_names)
-        df['parent_fraction'] = df.isotopic_abundance / 100.
-        return df
+        rows = [d.row for d in self.decays]
+        values = zip(*rows) if rows else [()] * len(self.initial_columns)
+        columns = {}
+        for (name, dtype), column in zip(self.initial_columns, values):
+            columns[name] = np.array(column, dtype=dtype)
+        columns['parent_fraction'] = columns['isotopic_abundance'] / 100.
+        return pd.DataFrame(columns, copy=False)
 
     def hyperphysics(self, **kwargs):
         """Return the Hyperphyscics calculation of the Gamow factor."""
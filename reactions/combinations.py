@@ -13,6 +13,8 @@ import os
 from os.path import expanduser
 import pickle
 
+import numpy as np
+
 from .nubase import Nuclides, Electron
 from .calculations import (
     IsotopicDecay,
@@ -20,6 +22,7 @@ from .calculations import (
     GeigerNuttal,
     Gamow2,
     ReactionEnergy,
+    mass_excess_kev,
 )
 
 
@@ -36,6 +39,17 @@ class RejectCombination(RuntimeError):
 class GammaPhoton:
     """Represent a gamma photon that results from a nuclear reaction."""
 
+    __slots__ = (
+        'mass_number',
+        'is_baryon',
+        'full_label',
+        'label',
+        'is_stable',
+        'spin_and_parity',
+        'numbers',
+        'notes',
+    )
+
     def __init__(self):
         self.mass_number = 0
         self.is_baryon = False
@@ -49,6 +63,19 @@ class GammaPhoton:
 class Reaction:
     """Model the parents and possible daughters of a nuclear reaction."""
 
+    __slots__ = (
+        'model_name',
+        'initial_lvalues',
+        'rvalues',
+        'q_value',
+        'is_stable',
+        'any_excited',
+        'lvalue_delim',
+        'rvalue_delim',
+        'daughter_count',
+        'gamow_value',
+    )
+
     @classmethod
     def load(cls, **kwargs):
         """Factory method returning a set of reactions for a given set of
@@ -93,23 +120,20 @@ class Reaction:
         output.
         """
         notes = set()
+        # The numbers of each parent after picking up a neutron
+        transfers = {(p.numbers[0] + 1, p.numbers[1]) for _, p in self.initial_lvalues}
         for _, daughter in self.rvalues:
             note = self._noteworthy.get(daughter.label)
             if note:
                 notes.add(note)
-            for _, parent in self.initial_lvalues:
-                if self._neutron_transfer(daughter, parent):
-                    notes.add('n-transfer')
+            if daughter.numbers in transfers:
+                notes.add('n-transfer')
         if self.is_stable:
             notes.add('in nature')
         for _, daughter in self.rvalues:
             notes |= daughter.notes
         return notes
 
-    def _neutron_transfer(self, daughter, parent):
-        result = map(operator.add, parent.numbers, (1, 0))
-        return daughter.numbers == tuple(result)
-
     def _is_stable(self):
         return all(d.is_stable for num, d in self.rvalues)
 
@@ -135,9 +159,10 @@ class Reaction:
     @property
     def is_single_body(self):
         """Is this reaction a decay?"""
-        if len(self.rvalues) > 1:
+        rvalues = self.rvalues
+        if len(rvalues) > 1:
             return False
-        return all(num == 1 for num, c in self.rvalues)
+        return not rvalues or rvalues[0][0] == 1
 
     def geiger_nuttal(self):
         """Do the Geiger-Nuttal computation for the decay components of this
@@ -185,6 +210,8 @@ class CalculateCombinations:
     if one is available.
     """
     basedir = os.path.expanduser('~/.reactions/objects')
+    # Upper bound on the number of candidate rows examined at once
+    _chunk_rows = 1 << 20
 
     def __init__(self, totals):
         self.totals = totals
@@ -196,37 +223,55 @@ class CalculateCombinations:
         to daughter nuclides at a later step.
         """
         iterator = self._cached_results()
-        if iterator:
+        if iterator is not None:
             yield from iterator
             return
 
-        results, seen = [], set()
-        for masses in vectors3(self.mass_number):
-            for protons in vectors3(self.atomic_number):
-                daughters = []
-
-                try:
-                    for i, mass in enumerate(masses):
-                        proton_count = protons[i]
-                        if mass < proton_count:
-                            raise RejectCombination
-                        pair = (mass, proton_count)
-                        if (0, 0) == pair:
-                            continue
-                        daughters.append(pair)
-                except RejectCombination:
-                    continue
-
-                daughters = tuple(sorted(daughters))
-                if daughters in seen:
-                    continue
-                seen.add(daughters)
-
-                results.append(daughters)
-                yield daughters
-
+        results = self._combinations()
+        yield from results
         self._cache_results(results)
 
+    def _combinations(self):
+        # Each daughter (mass, protons) is encoded as m * (Z + 1) + z, so that
+        # ordering the codes orders the daughters, and each set of three codes
+        # is packed into a single integer key for deduplication.
+        base = self.atomic_number + 1
+        width = (self.mass_number + 1) * base
+        masses = np.array(list(vectors3(self.mass_number)), dtype=np.int64).reshape(-1, 3)
+        protons = np.array(list(vectors3(self.atomic_number)), dtype=np.int64).reshape(-1, 3)
+        chunk_size = max(1, self._chunk_rows // max(1, len(protons)))
+        keys = []
+        for start in range(0, len(masses), chunk_size):
+            chunk = masses[start:start + chunk_size, None, :]
+            valid = (chunk >= protons).all(axis=2)
+            candidates = (chunk * base + protons)[valid]
+            candidates.sort(axis=1)
+            chunk_keys = (candidates[:, 0] * width + candidates[:, 1]) * width + \
+                candidates[:, 2]
+            _, index = np.unique(chunk_keys, return_index=True)
+            keys.append(chunk_keys[np.sort(index)])
+        keys = np.concatenate(keys) if keys else np.empty(0, dtype=np.int64)
+        _, index = np.unique(keys, return_index=True)
+        return self._decode(keys[np.sort(index)], base, width)
+
+    @staticmethod
+    def _decode(keys, base, width):
+        """Convert packed keys back into tuples of (mass, protons) pairs."""
+        # Decode through a table of (mass, protons) pairs, so that each distinct
+        # daughter is a single shared tuple.  The sorted codes put any empty
+        # daughters, (0, 0), first.
+        pairs = [divmod(code, base) for code in range(width)]
+        columns = np.stack([keys // (width * width), keys // width % width, keys % width], axis=1)
+        results = []
+        for code0, code1, code2 in columns.tolist():
+            if code0:
+                results.append((pairs[code0], pairs[code1], pairs[code2]))
+            elif code1:
+                results.append((pairs[code1], pairs[code2]))
+            else:
+                results.append((pairs[code2],))
+        return results
+
     @property
     def _cache_key(self):
         string = json.dumps(self.totals, sort_keys=True).encode('utf-8')
@@ -242,8 +287,10 @@ class CalculateCombinations:
             os.makedirs(self.basedir)
         except FileExistsError:
             pass
-        with gzip.open(self.cache_path, 'wb+') as file:
-            pickle.dump(results, file)
+        # The results are written as a single pickled list.  A low compression
+        # level keeps writing the cache cheaper than computing the results.
+        with gzip.open(self.cache_path, 'wb+', compresslevel=1) as file:
+            file.write(pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL))
 
     def _cached_results(self):
         if not os.path.exists(self.cache_path):
@@ -402,7 +449,7 @@ class SeparatedNuclideModel(Model):
         _, daughter = parents[0]
         assert len(daughters) == 2
         parent_numbers = add_numbers(daughters[0].numbers, daughters[1].numbers)
-        for parent in self.nuclides.isomers[parent_numbers]:
+        for parent in self.nuclides.isomers.get(parent_numbers, []):
             if not parent.in_nature:
                 continue
             if parent.mass_number == daughter.mass_number:
@@ -477,11 +524,19 @@ class Combinations:
         return self._model.sort_key(reactions)
 
     def _reactions(self):
+        # Daughter sets that _allowed() would reject for their size or for an
+        # excited daughter are dropped here, before any reactions are built.
         nuclides = Nuclides.data()
         for daughters in self._daughters():
-            isomers = [nuclides.isomers[pair] for pair in daughters]
+            if self.daughter_count and len(daughters) not in self.daughter_count:
+                continue
+            isomers = [nuclides.isomers.get(pair) for pair in daughters]
             if not all(isomers):
                 continue
+            if not self._excited:
+                isomers = [[n for n in ns if not n.is_excited] for ns in isomers]
+                if not all(isomers):
+                    continue
             yield from itertools.product(*isomers)
 
     def _daughters(self):
@@ -499,9 +554,15 @@ class Combinations:
             return
 
         for daughters in self._reactions():
+            rvalues = [(1, d) for d in daughters]
+            daughters_kev = mass_excess_kev(rvalues)
             all_parents = self._model.parents(self._parents, daughters)
             for parents in all_parents:
-                rvalues = ((1, d) for d in daughters)
+                # Skip building reactions whose Q-value is out of bounds.
+                parents = list(parents)
+                kev = mass_excess_kev(parents) - daughters_kev
+                if not self._lower_bound < kev <= self._upper_bound:
+                    continue
                 reaction = Reaction(parents, rvalues, **self._kwargs)
                 if not self._allowed(reaction):
                     continue
@@ -0,0 +1,52 @@
+"""
+Array kernels used by the decay calculations.  Each kernel works on plain 1-d
+NumPy arrays rather than Pandas series.  Some steps, such as the exponential
+in decay_kernel, are done in place on an array the kernel has just created,
+but most still allocate temporaries as ordinary NumPy expressions do.
+"""
+# pylint: disable=invalid-name
+import math
+import numpy as np
+
+
+def barrier_integral(ratio):
+    """Compute acos(sqrt(r)) - sqrt(r * (1 - r)) for each radius ratio r, which
+    is zero when r >= 1, i.e., when there is no Coulomb barrier to cross.
+    """
+    r = np.minimum(ratio, 1.)
+    out = np.sqrt(r)
+    np.arccos(out, out=out)
+    out -= np.sqrt(r * (1. - r))
+    return out
+
+
+def decay_kernel(gamow_factor, assault_frequency):
+    """Compute the tunneling probability, the partial decay constant and the
+    partial half-life for each row from its Gamow factor and barrier assault
+    frequency.
+    """
+    tunneling_probability = np.multiply(-2., gamow_factor)
+    np.exp(tunneling_probability, out=tunneling_probability)
+    partial_decay_constant = tunneling_probability * assault_frequency
+    partial_half_life = np.full_like(partial_decay_constant, math.inf)
+    np.divide(
+        math.log(2),
+        partial_decay_constant,
+        out=partial_half_life,
+        where=partial_decay_constant > 0,
+    )
+    return tunneling_probability, partial_decay_constant, partial_half_life
+
+
+def group_sum(values, *keys):
+    """Sum the values within each group of rows sharing the same integer keys,
+    and return the sum for each row's group.  NaNs are skipped, as in Pandas.
+    """
+    columns = np.column_stack([np.asarray(k, dtype=np.int64) for k in keys])
+    groups, inverse = np.unique(columns, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    weights = np.asarray(values, dtype=np.float64)
+    weights = np.where(np.isnan(weights), 0., weights)
+    sums = np.bincount(inverse, weights=weights, minlength=len(groups))
+    # np.bincount returns integers for empty input, even with weights
+    return sums[inverse].astype(np.float64, copy=False)
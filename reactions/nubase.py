@@ -6,7 +6,6 @@ from __future__ import absolute_import
 import os
 import re
 import itertools
-from collections import defaultdict
 
 from .units import Energy, HalfLife
 from .constants import DALTON_KEV
@@ -15,6 +14,8 @@ from .constants import DALTON_KEV
 BASEPATH = os.path.dirname(__file__)
 NUBASE_PATH = os.path.abspath(os.path.join(BASEPATH, "../db/nubtab12.asc"))
 
+DECAY_MODE_DELIMITERS = re.compile(r'[;=~<]')
+
 
 ALTERNATE_LABELS = {
     '1 n':    'n',
@@ -249,17 +250,32 @@ class BadNubaseRow(RuntimeError):
     pass
 
 
-def first_match(pattern, string):
-    """Return the first match of <pattern>"""
-    match = re.search(pattern, string)
-    if not match:
-        return None
-    return match.group()
-
-
 class Nuclide:
     """Model an individual nuclide that will participate in reactions."""
 
+    __slots__ = (
+        'row',
+        'initial_label',
+        'atomic_number',
+        'is_baryon',
+        'mass_number',
+        'neutron_number',
+        'numbers',
+        '_spin_and_parity',
+        'isotopic_abundance',
+        'is_stable',
+        'is_trace',
+        'in_nature',
+        'is_excited',
+        'label',
+        '_excitation_level',
+        'full_label',
+        'signature',
+        'mass_excess_kev',
+        'mass',
+        '_notes',
+    )
+
     _columns = (
         (4, 'massNumber'),
         (7, 'atomicNumber'),
@@ -277,6 +293,12 @@ class Nuclide:
         (-1, 'decayModesAndIntensities'),
     )
 
+    # (field, slice) pairs for each of the fixed-width columns above
+    _slices = tuple(
+        (field, slice(start, end)) for start, (end, field)
+        in zip((0,) + tuple(end for end, _ in _columns), _columns)
+    )
+
     _not_excited = {
         '1 n',
         '3Li',
@@ -324,12 +346,10 @@ class Nuclide:
         """Load the nuclide from a line in the Nubase file."""
         line = kwargs['line']
         row = {}
-        endcol_prev = 0
-        for endcol, field in cls._columns:
-            text = line[endcol_prev:endcol].strip()
+        for field, columns in cls._slices:
+            text = line[columns].strip()
             if text:
                 row[field] = text
-            endcol_prev = endcol
         return cls(row)
 
     def __init__(self, row):
@@ -343,24 +363,28 @@ class Nuclide:
 
     def _initialize_basic_fields(self):
         self.initial_label = self.row['nuclide']
-        self.atomic_number = int(first_match(r'\d+', self.row['atomicNumber']))
+        self.atomic_number = int(self.row['atomicNumber'])
         self.is_baryon = True
         self.mass_number = int(self.row['massNumber'])
         self.neutron_number = self.mass_number - self.atomic_number
         self.numbers = (self.mass_number, self.atomic_number)
-        self.spin_and_parity = None
-        if 'spinAndParity' in self.row:
-            self.spin_and_parity = ' '.join(self.row['spinAndParity'].split())
+        # Notes and spin and parity are only needed for the nuclides in the
+        # reactions that are printed, so they are computed on first use.
+        self._spin_and_parity = None
+        self._notes = None
 
     def _initialize_isotope_fields(self):
         decays = self.row.get('decayModesAndIntensities', '')
-        matches = re.search(r'IS=([\d\.]+)', decays)
-        self.isotopic_abundance = float(matches.group(1)) if matches else 0.
-        self.is_stable = matches is not None
+        # e.g., "IS=96.94 16;2B+ ?"
+        _, found, abundance = decays.partition('IS=')
+        abundance = abundance.partition(' ')[0].partition(';')[0]
+        self.isotopic_abundance = float(abundance) if found else 0.
+        self.is_stable = bool(found)
         self.is_trace = self.initial_label in TRACE_ISOTOPES
         self.in_nature = self.is_stable or self.is_trace
 
     def _initialize_isomer_fields(self):
+        self.is_excited = self._is_excited()
         if self.is_excited:
             label, self._excitation_level = self.initial_label[:-1], self.initial_label[-1]
             self.label = ALTERNATE_LABELS.get(label, label)
@@ -372,7 +396,8 @@ class Nuclide:
         self.signature = (self.label, self._excitation_level)
 
     def _initialize_calculated_fields(self):
-        kev = first_match(r'[\d\.\-]+', self.row['massExcess'])
+        # e.g., "-64472.5     0.5", or "28670#    2000#" for estimated values
+        kev = self.row['massExcess'].split()[0].rstrip('#')
         self.mass_excess_kev = float(kev)
         self.mass = Energy.load(kev=self.mass_number * DALTON_KEV + self.mass_excess_kev)
 
@@ -401,23 +426,34 @@ class Nuclide:
     @property
     def notes(self):
         """Are there any notes to include with this isotope?"""
-        matches = re.split(r'[;=~<]', self.row.get('decayModesAndIntensities', ''))
+        if self._notes is None:
+            self._notes = self._parse_notes()
+        return self._notes
+
+    def _parse_notes(self):
+        matches = DECAY_MODE_DELIMITERS.split(self.row.get('decayModesAndIntensities', ''))
         notes = {self._noteworthy.get(token) for token in filter(None, matches)} - {None}
         if self.is_trace:
             notes.add('trace')
-        return notes
+        return frozenset(notes)
 
-    @property
-    def is_excited(self):
+    def _is_excited(self):
         """Is the nuclide an isomer in an excited state?"""
         if self.isotopic_abundance:
             return False
         if self.initial_label in self._not_excited:
             return False
-        matches = re.findall('[a-z]', self.initial_label)
-        if len(matches) > 1:
-            return True
-        return False
+        # An element symbol has at most one lowercase letter, so a second
+        # one is an isomer suffix.
+        lowercase = sum(1 for c in self.initial_label if 'a' <= c <= 'z')
+        return lowercase > 1
+
+    @property
+    def spin_and_parity(self):
+        """What are the spin and parity of this nuclide, if known?"""
+        if self._spin_and_parity is None and 'spinAndParity' in self.row:
+            self._spin_and_parity = ' '.join(self.row['spinAndParity'].split())
+        return self._spin_and_parity
 
     @property
     def half_life(self):
@@ -478,21 +514,35 @@ class Nuclides:
         self._nuclides = list(nuclides)
         self._by_label = {}
         self._by_signature = {}
-        self._by_atomic_number = defaultdict(list)
-        self.isomers = defaultdict(list)
+        self._by_atomic_number = {}
+        self._in_nature_by_atomic_number = {}
+        self.isomers = {}
         self.trace = {}
         self._index_nuclides()
 
     def _index_nuclides(self):
+        by_label = self._by_label
+        by_signature = self._by_signature
+        by_atomic_number = self._by_atomic_number
+        in_nature_by_atomic_number = self._in_nature_by_atomic_number
+        isomers = self.isomers
         for nuclide in self._nuclides:
-            self._by_label[nuclide.initial_label] = nuclide
-            self._by_signature[nuclide.signature] = nuclide
-            self._by_atomic_number[nuclide.atomic_number].append(nuclide)
-            self.isomers[nuclide.numbers].append(nuclide)
+            by_label[nuclide.initial_label] = nuclide
+            by_signature[nuclide.signature] = nuclide
+            by_atomic_number.setdefault(nuclide.atomic_number, []).append(nuclide)
+            if nuclide.in_nature and not nuclide.is_excited:
+                in_nature_by_atomic_number.setdefault(nuclide.atomic_number, []).append(nuclide)
+            isomers.setdefault(nuclide.numbers, []).append(nuclide)
 
     def atomic_number(self, atomic_number):
         """What is the nuclide for this number?"""
-        return self._by_atomic_number[atomic_number]
+        return self._by_atomic_number.get(atomic_number, [])
+
+    def in_nature(self, atomic_number):
+        """What are the nuclides for this number that are found in nature, in
+        their ground states?
+        """
+        return self._in_nature_by_atomic_number.get(atomic_number, [])
 
     def get(self, signature):
         """Return a nuclide for a given signature."""
@@ -505,11 +555,13 @@ class Nuclides:
         return self._by_signature[signature]
 
 
-def stable_nuclides(nuclides, unstable_parents):
-    """Return an interateor of (1, nuclide) tuples."""
+def stable_nuclides(database, atomic_number, unstable_parents):
+    """Return a list of (1, nuclide) tuples."""
     if unstable_parents:
-        return ((1, n) for n in nuclides)
-    return ((1, n) for n in nuclides if n.in_nature and not n.is_excited)
+        nuclides = database.atomic_number(atomic_number)
+    else:
+        nuclides = database.in_nature(atomic_number)
+    return [(1, n) for n in nuclides]
 
 
 def parse_spec(spec, **kwargs):
@@ -531,14 +583,11 @@ def parse_spec(spec, **kwargs):
             for number in ELEMENTS.values():
                 if number > parent_ub:
                     continue
-                nuclides = database.atomic_number(number)
-                row.extend(stable_nuclides(nuclides, unstable_parents))
+                row.extend(stable_nuclides(database, number, unstable_parents))
             reactants.append(row)
             continue
 
         number = ELEMENTS[label]
-        nuclides = database.atomic_number(number)
-        iterator = stable_nuclides(nuclides, unstable_parents)
-        reactants.append(iterator)
+        reactants.append(stable_nuclides(database, number, unstable_parents))
 
     return itertools.product(*reactants)
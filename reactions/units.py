@@ -58,6 +58,8 @@ class Distance:
 class HalfLife:
     """Model the half-life of a radionuclide."""
 
+    __slots__ = ('value', 'unit')
+
     def __init__(self, value, unit):
         self.value = value
         self.unit = unit
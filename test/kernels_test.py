@@ -0,0 +1,35 @@
+# pylint: disable=missing-docstring
+import unittest
+import math
+
+import numpy as np
+
+from reactions.kernels import barrier_integral, group_sum
+
+
+class BarrierIntegralTest(unittest.TestCase):
+    def test_below_barrier(self):
+        ratios = np.array([0., 0.25, 0.5])
+        expected = [math.acos(math.sqrt(r)) - math.sqrt(r * (1 - r)) for r in ratios]
+        np.testing.assert_allclose(expected, barrier_integral(ratios))
+
+    def test_above_barrier(self):
+        np.testing.assert_equal([0., 0.], barrier_integral(np.array([1., 3.])))
+
+
+class GroupSumTest(unittest.TestCase):
+    def test_group_sum(self):
+        values = np.array([1., 2., 3., 4.])
+        a = np.array([190, 192, 190, 192])
+        z = np.array([78, 78, 78, 78])
+        np.testing.assert_equal([4., 6., 4., 6.], group_sum(values, a, z))
+
+    def test_nan_skipped(self):
+        values = np.array([1., np.nan, 3.])
+        a = np.array([4, 4, 8])
+        np.testing.assert_equal([1., 1., 3.], group_sum(values, a))
+
+    def test_empty(self):
+        result = group_sum(np.array([]), np.array([]), np.array([]))
+        self.assertEqual(np.float64, result.dtype)
+        self.assertEqual(0, len(result))